@@ -1,12 +1,24 @@
 from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, validator
-from typing import List
+from pydantic import AfterValidator, BaseModel, Field, field_serializer
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from datetime import datetime
 from decimal import Decimal
-import io
+from functools import lru_cache, partial
+from hashlib import blake2b
+import asyncio
+import json
+import multiprocessing
+import os
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfdoc import PDFArray
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 import logging
 
@@ -14,10 +26,59 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# PDF rendering is CPU-bound, so it runs in worker processes to keep the
+# event loop free. They come from a forkserver rather than being forked from
+# the (multithreaded) server process, and are started on demand. The pool is
+# created on first use so processes that merely import this module (e.g. the
+# pool's own workers) don't build one.
+# Each server worker gets an equal share of the cores, so N uvicorn workers
+# don't each start a full-size pool. WEB_CONCURRENCY is uvicorn's own
+# worker-count variable and is set by the launcher below.
+_SERVER_WORKERS = max(1, int(os.environ.get("WEB_CONCURRENCY", "1")))
+_PDF_POOL_SIZE = max(1, (os.cpu_count() or 1) // _SERVER_WORKERS)
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+
+def _get_pdf_executor() -> ProcessPoolExecutor:
+    global _pdf_executor
+    if _pdf_executor is None:
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=_PDF_POOL_SIZE,
+            mp_context=multiprocessing.get_context("forkserver")
+        )
+    return _pdf_executor
+
+async def _run_in_pdf_pool(fn):
+    """
+    Run fn in the PDF pool. If a worker died (OOM kill, segfault) the pool
+    is unusable, so it is replaced and the call retried once; a second
+    BrokenProcessPool is raised to the caller.
+    """
+    global _pdf_executor
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        executor = _get_pdf_executor()
+        try:
+            return await loop.run_in_executor(executor, fn)
+        except BrokenProcessPool:
+            logger.warning("PDF worker pool is broken; starting a new one")
+            executor.shutdown(wait=False)
+            # Another request may already have replaced it
+            if _pdf_executor is executor:
+                _pdf_executor = None
+            if attempt:
+                raise
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown()
+
 app = FastAPI(
     title="Invoice Statement Generator API",
     description="Production-ready API for generating invoice statements and payment advice",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -29,36 +90,60 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Load the standard fonts and their metrics once at import instead of on
+# the first canvas that uses them
+for _font_name in ("Helvetica", "Helvetica-Bold"):
+    pdfmetrics.getFont(_font_name)
+    stringWidth("", _font_name, 9)
+
+# Cache of rendered PDFs keyed by request hash, bounded by total size per
+# server worker (least recently used evicted first)
+PDF_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_pdf_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+_pdf_cache_bytes = 0
+
+def _cache_pdf(key: bytes, pdf_bytes: bytes) -> None:
+    """Store a rendered PDF, evicting old entries to stay under the byte limit"""
+    global _pdf_cache_bytes
+    if len(pdf_bytes) > PDF_CACHE_MAX_BYTES or key in _pdf_cache:
+        return
+    _pdf_cache[key] = pdf_bytes
+    _pdf_cache_bytes += len(pdf_bytes)
+    while _pdf_cache_bytes > PDF_CACHE_MAX_BYTES:
+        _, evicted = _pdf_cache.popitem(last=False)
+        _pdf_cache_bytes -= len(evicted)
+
 # Pydantic Models
+def round_decimal(v: Decimal) -> Decimal:
+    return v.quantize(Decimal("0.01"))
+
+# Non-negative money amount, rounded to 2 decimal places (half-even)
+Amount = Annotated[Decimal, Field(ge=0), AfterValidator(round_decimal)]
+
 class InvoiceItem(BaseModel):
     date: str
     activity: str  # Display text for the activity
     invoice_url: str  # URL for the invoice link
     reference: str  # Reference number/text
     due_date: str
-    invoice_amount: Decimal = Field(ge=0)
-    payments: Decimal = Field(default=Decimal("0.00"), ge=0)
-    
-    @validator('invoice_amount', 'payments')
-    def round_decimal(cls, v):
-        return round(v, 2)
+    invoice_amount: Amount
+    payments: Amount = Decimal("0.00")
     
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v)
-        }
+    @field_serializer('invoice_amount', 'payments', when_used='json')
+    def serialize_decimal(self, v: Decimal) -> float:
+        return float(v)
 
 class StatementRequest(BaseModel):
     client_name: str = Field(..., min_length=1, max_length=200)
     company_name: str = Field(..., min_length=1, max_length=200)
     from_date: str
     to_date: str
-    invoices: List[InvoiceItem] = Field(..., min_items=1)
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v)
-        }
+    invoices: List[InvoiceItem] = Field(..., min_length=1)
+
+class HealthResponse(BaseModel):
+    status: str
+    service: str
+    version: str
 
 class StatementResponse(BaseModel):
     message: str
@@ -67,218 +152,287 @@ class StatementResponse(BaseModel):
     current_amount: float
     file_size: int
 
-# PDF Generation Functions
-def generate_statement_pdf(data: StatementRequest) -> bytes:
-    """Generate PDF statement document with exact design"""
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
-    width, height = A4  # 595 x 842 points
-    
-    # Define colors
-    gray_line = colors.HexColor("#CCCCCC")
-    blue_link = colors.HexColor("#0066CC")
+# Statement Calculations
+def _to_cents(amount: Decimal) -> int:
+    """Convert a 2 dp amount to integer cents"""
+    return int(amount.scaleb(2))
+
+def _format_cents(cents: int) -> str:
+    """Format integer cents like f"{amount:,.2f}" without going through float"""
+    sign = "-" if cents < 0 else ""
+    units, rem = divmod(abs(cents), 100)
+    return f"{sign}{units:,}.{rem:02d}"
+
+def _aggregate(
+    invoices: List[InvoiceItem]
+) -> Tuple[List[int], int, int, int]:
+    """
+    Compute statement totals in a single pass over the invoices.
+    All amounts are integer cents. Returns
+    (row_balances, running_cents, overdue_cents, current_cents) where
+    row_balances holds the running balance after each invoice.
+    """
+    row_balances = []
+    running_cents = 0
     
-    # Define margins
-    left_margin = 40
-    right_margin = 40
-    available_width = width - left_margin - right_margin  # 515 points
+    for inv in invoices:
+        running_cents += _to_cents(inv.invoice_amount) - _to_cents(inv.payments)
+        row_balances.append(running_cents)
     
-    # Starting Y position
-    y = height - 50
+    # All invoices are treated as overdue
+    overdue_cents = running_cents
+    current_cents = 0
     
-    # ============ HEADER SECTION ============
-    # Title "STATEMENT - Activity"
+    return row_balances, running_cents, overdue_cents, current_cents
+
+# PDF Generation Functions
+# Page geometry and colors shared by every statement
+_PAGE_WIDTH, _PAGE_HEIGHT = A4  # 595 x 842 points
+_LEFT_MARGIN = 40
+_RIGHT_MARGIN = 40
+_LINE_END = _PAGE_WIDTH - _RIGHT_MARGIN  # Right end of full-width rules
+
+# Table column positions (amount columns are right-aligned on these edges)
+_COL_DATE = _LEFT_MARGIN
+_COL_ACTIVITY = _LEFT_MARGIN + 100
+_COL_REFERENCE = _LEFT_MARGIN + 170
+_COL_DUE_DATE = _LEFT_MARGIN + 260
+_COL_INVOICE_AMT_RIGHT = _LEFT_MARGIN + 430
+_COL_BALANCE_RIGHT = _LEFT_MARGIN + 500
+
+_GRAY_LINE = colors.HexColor("#CCCCCC")
+_BLUE_LINK = colors.HexColor("#0066CC")
+
+@lru_cache(maxsize=4096)
+def _hv9_width(text: str) -> float:
+    """Width of text in Helvetica 9pt (used for link areas)"""
+    return stringWidth(text, "Helvetica", 9)
+
+# Hidden link border shared by every invoice link, so ReportLab does not
+# build a default border array for each annotation
+_NO_BORDER = PDFArray([0, 0, 0])
+
+# ============ STATIC PAGE TEMPLATE ============
+# Fonts are registered on every canvas in this order before the template is
+# replayed, so the internal font names baked into it stay valid
+_TEMPLATE_FONTS = (("Helvetica", "/F1"), ("Helvetica-Bold", "/F2"))
+
+def _register_template_fonts(c: canvas.Canvas) -> None:
+    """Register the template fonts and check they got the expected names"""
+    for font_name, internal_name in _TEMPLATE_FONTS:
+        c.setFont(font_name, 9)
+        if c._doc.getInternalFontName(font_name) != internal_name:
+            raise RuntimeError(
+                f"Font {font_name} registered as "
+                f"{c._doc.getInternalFontName(font_name)}, expected {internal_name}; "
+                "the cached PDF templates would reference the wrong font"
+            )
+
+def _draw_header_template(c: canvas.Canvas) -> None:
+    """Fixed header labels and table column headers"""
+    y = _PAGE_HEIGHT - 50
+    c.setFillColor(colors.black)
     c.setFont("Helvetica", 22)
-    c.drawString(left_margin, y, "ACCOUNT STATEMENT")
-    
-    # Right side header info
+    c.drawString(_LEFT_MARGIN, y, "ACCOUNT STATEMENT")
     c.setFont("Helvetica-Bold", 9)
     c.drawString(360, y, "From Date")
-    c.setFont("Helvetica", 9)
-    c.drawString(480, y, data.client_name)
+    c.drawString(360, y - 28, "To Date")
     
-    y -= 15
-    c.setFont("Helvetica", 9)
-    c.drawString(360, y, data.from_date)
+    # Table headers
+    y = _PAGE_HEIGHT - 165
+    c.drawString(_COL_DATE, y, "Date")
+    c.drawString(_COL_ACTIVITY, y, "Activity")
+    c.drawString(_COL_REFERENCE, y, "Reference")
+    c.drawString(_COL_DUE_DATE, y, "Due Date")
+    c.drawRightString(_COL_INVOICE_AMT_RIGHT, y, "Invoice Amount")
+    c.drawRightString(_COL_BALANCE_RIGHT, y, "Balance AUD")
+    
+    # Line under headers
+    y -= 3
+    c.setStrokeColor(colors.black)
+    c.setLineWidth(1)
+    c.line(_LEFT_MARGIN, y, _LINE_END, y)
+
+def _draw_payment_advice_template(c: canvas.Canvas) -> None:
+    """Fixed payment advice labels, relative to the dotted line at y=0"""
+    c.setFillColor(colors.black)
+    c.setStrokeColor(colors.black)
+    c.setLineWidth(0.5)
+    c.setDash([2, 2])  # Dotted line pattern
+    c.line(_LEFT_MARGIN, 0, _LINE_END, 0)
+    c.setDash([])  # Reset to solid line
+    
+    c.setFont("Helvetica", 23)
+    c.drawString(_LEFT_MARGIN, -30, "PAYMENT ADVICE")
     
-    y -= 13
     c.setFont("Helvetica-Bold", 9)
-    c.drawString(360, y, "To Date")
+    c.drawString(320, -85, "Customer")
+    c.line(320, -90, _LINE_END, -90)
+    c.drawString(320, -103, "Overdue")
+    c.drawString(395, -103, "Current")
+    c.drawString(470, -103, "Total AUD Due")
+    c.line(320, -123, _LINE_END, -123)
+    c.drawString(320, -136, "Amount Enclosed")
+
+def _render_template(draw) -> str:
+    """Run draw() on a scratch canvas and return the PDF operators it emits"""
+    c = canvas.Canvas(None, pagesize=A4)
+    _register_template_fonts(c)
+    # ReportLab has no public way to read back emitted operators, so this
+    # reads the canvas' private content list; it only runs at import
+    start = len(c._code)
+    draw(c)
+    return "\n".join(c._code[start:])
+
+# Rendered once at import; replayed inside q/Q so they leave no state behind
+_HEADER_TEMPLATE = _render_template(_draw_header_template)
+_PAYMENT_ADVICE_TEMPLATE = _render_template(_draw_payment_advice_template)
+
+def generate_statement_pdf(
+    data: Dict[str, Any],
+    *,
+    row_balances: List[int],
+    running_cents: int,
+    overdue_cents: int,
+    current_cents: int
+) -> bytes:
+    """
+    Generate PDF statement document with exact design (amounts in cents).
+    data is a dumped StatementRequest so it can be sent to a worker process;
+    the totals come precomputed from _aggregate.
+    """
+    # No output file: the PDF is taken straight from the canvas at the end
+    c = canvas.Canvas(None, pagesize=A4)
+    
+    # Starting Y position
+    y = _PAGE_HEIGHT - 50
+    
+    # ============ HEADER SECTION ============
+    # Static labels and table headers come from the prerendered template
+    _register_template_fonts(c)
+    c.addLiteral(f"q\n{_HEADER_TEMPLATE}\nQ")
     
-    y -= 15
+    # Right side header info
     c.setFont("Helvetica", 9)
-    c.drawString(360, y, data.to_date)
+    c.drawString(480, y, data["client_name"])
+    c.drawString(360, y - 15, data["from_date"])
+    c.drawString(360, y - 43, data["to_date"])
     
     # Company name below title
-    y = height - 105
+    y = _PAGE_HEIGHT - 105
     c.setFont("Helvetica", 10)
-    c.drawString(left_margin, y, data.company_name)
+    c.drawString(_LEFT_MARGIN, y, data["company_name"])
     
     # ============ TABLE SECTION ============
-    y = height - 165
-    
-    # Table column positions
-    col_date = left_margin
-    col_activity = left_margin + 100
-    col_reference = left_margin + 170
-    col_due_date = left_margin + 260
-    col_invoice_amt = left_margin + 390
-    col_balance = left_margin + 460
-    
-    # Draw table headers
-    c.setFont("Helvetica-Bold", 9)
-    c.drawString(col_date, y, "Date")
-    c.drawString(col_activity, y, "Activity")
-    c.drawString(col_reference, y, "Reference")
-    c.drawString(col_due_date, y, "Due Date")
-    c.drawRightString(col_invoice_amt + 40, y, "Invoice Amount")
-    c.drawRightString(col_balance + 40, y, "Balance AUD")
-    
-    # Line under headers
-    y -= 3
-    c.setStrokeColor(colors.black)
-    c.setLineWidth(1)
-    c.line(left_margin, y, width - right_margin, y)
-    
-    # Calculate running balance
-    running_balance = Decimal("0.00")
+    y = _PAGE_HEIGHT - 168  # Just below the header line
     
     # ============ INVOICE ROWS ============
-    for invoice in data.invoices:
+    # All row text goes into a single text object (one BT/ET block) and the
+    # separators into a single lines() call, rather than issuing separate
+    # canvas operations for every cell. Each row starts with an absolute
+    # origin; cells within it use short relative cursor moves.
+    # Rows keep the bold header font that was active when they were drawn
+    row_text = c.beginText()
+    row_text.setFont("Helvetica-Bold", 9)
+    separators = []
+    links = []
+    
+    for invoice, row_balance in zip(data["invoices"], row_balances):
         y -= 15
-        balance = invoice.invoice_amount - invoice.payments
-        running_balance += balance
-        
-        c.setFillColor(colors.black)
         
         # Date
-        c.drawString(col_date, y, invoice.date)
+        row_text.setTextOrigin(_COL_DATE, y)
+        row_text.setFillColor(colors.black)
+        row_text.textOut(invoice["date"])
         
         # Activity - Display activity text as clickable blue link
-        c.setFillColor(blue_link)
-        c.drawString(col_activity, y, invoice.activity)
-        
-        # Create clickable link area using invoice_url
-        link_width = c.stringWidth(invoice.activity, "Helvetica", 9)
-        c.linkURL(
-            invoice.invoice_url, 
-            (col_activity, y - 2, col_activity + link_width, y + 10),
-            relative=0
-        )
+        row_text.moveCursor(_COL_ACTIVITY - _COL_DATE, 0)
+        row_text.setFillColor(_BLUE_LINK)
+        row_text.textOut(invoice["activity"])
         
-        c.setFillColor(colors.black)
+        # Clickable link area using invoice_url
+        link_width = _hv9_width(invoice["activity"])
+        links.append((
+            invoice["invoice_url"],
+            (_COL_ACTIVITY, y - 2, _COL_ACTIVITY + link_width, y + 10)
+        ))
         
         # Reference column
-        c.drawString(col_reference, y, invoice.reference)
+        row_text.moveCursor(_COL_REFERENCE - _COL_ACTIVITY, 0)
+        row_text.setFillColor(colors.black)
+        row_text.textOut(invoice["reference"])
         
         # Due Date
-        c.drawString(col_due_date, y, invoice.due_date)
+        row_text.moveCursor(_COL_DUE_DATE - _COL_REFERENCE, 0)
+        row_text.textOut(invoice["due_date"])
         
-        # Invoice Amount
-        c.drawRightString(col_invoice_amt + 40, y, f"{invoice.invoice_amount:,.2f}")
+        # Invoice Amount (right-aligned)
+        amount = _format_cents(_to_cents(invoice["invoice_amount"]))
+        amount_x = _COL_INVOICE_AMT_RIGHT - stringWidth(amount, "Helvetica-Bold", 9)
+        row_text.moveCursor(amount_x - _COL_DUE_DATE, 0)
+        row_text.textOut(amount)
         
-        # Balance
-        c.drawRightString(col_balance + 40, y, f"{running_balance:,.2f}")
+        # Balance (right-aligned)
+        balance = _format_cents(row_balance)
+        balance_x = _COL_BALANCE_RIGHT - stringWidth(balance, "Helvetica-Bold", 9)
+        row_text.moveCursor(balance_x - amount_x, 0)
+        row_text.textOut(balance)
         
         # Light gray line
         y -= 3
-        c.setStrokeColor(gray_line)
-        c.line(left_margin, y, width - right_margin, y)
+        separators.append((_LEFT_MARGIN, y, _LINE_END, y))
+    
+    c.drawText(row_text)
+    
+    c.setStrokeColor(_GRAY_LINE)
+    c.lines(separators)
+    
+    for url, rect in links:
+        c.linkURL(url, rect, relative=0, Border=_NO_BORDER)
     
     # Bottom line
     y -= 10
     c.setStrokeColor(colors.black)
     c.setLineWidth(1)
-    c.line(left_margin, y, width - right_margin, y)
+    c.line(_LEFT_MARGIN, y, _LINE_END, y)
     
     # ============ BALANCE DUE ============
     y -= 25
     c.setFont("Helvetica-Bold", 11)
     c.setFillColor(colors.black)
-    balance_text = f"BALANCE DUE AUD  {running_balance:,.2f}"
-    c.drawRightString(width - right_margin, y, balance_text)
-    
-    # ============ FULL WIDTH DOTTED LINE ============
-    y -= 100
-    c.setStrokeColor(colors.black)
-    c.setLineWidth(0.5)
-    c.setDash([2, 2])  # Dotted line pattern
-    c.line(left_margin, y, width - right_margin, y)
-    c.setDash([])  # Reset to solid line
+    balance_text = f"BALANCE DUE AUD  {_format_cents(running_cents)}"
+    c.drawRightString(_LINE_END, y, balance_text)
     
     # ============ PAYMENT ADVICE SECTION ============
-    y -= 30
-    c.setFont("Helvetica", 23)
-    c.drawString(left_margin, y, "PAYMENT ADVICE")
+    # Dotted line and static labels come from the prerendered template,
+    # shifted to sit below the balance due
+    y -= 100
+    c.addLiteral(f"q 1 0 0 1 0 {y} cm\n{_PAYMENT_ADVICE_TEMPLATE}\nQ")
     
-    y -= 20
     c.setFont("Helvetica", 9)
-    c.drawString(left_margin, y, f"To: {data.client_name}")
-    
-    # Calculate overdue and current
-    overdue = Decimal("0.00")
-    current = Decimal("0.00")
-    
-    # Sum all invoices as overdue
-    for inv in data.invoices:
-        balance = inv.invoice_amount - inv.payments
-        overdue += balance
-    
-    # ============ PAYMENT DETAILS TABLE ============
-    y -= 35
-    
- 
+    c.drawString(_LEFT_MARGIN, y - 50, f"To: {data['client_name']}")
     
     # Customer row
-    c.setFont("Helvetica-Bold", 9)
-    c.drawString(320, y, "Customer")
-    c.setFont("Helvetica", 9)
-    c.drawString(440, y, data.company_name)
-    
-    y -= 5
-    # Line after Customer
-    c.line(320, y, width - right_margin, y)
-    
-    y -= 13  
-    # Overdue, Current, Total row (all on one line)
-    c.setFont("Helvetica-Bold", 9)
-    c.drawString(320, y, "Overdue")
-    c.drawString(395, y, "Current")
-    c.drawString(470, y, "Total AUD Due")
-    
-    y -= 15
-    c.setFont("Helvetica", 9)
-    c.drawString(320, y, f"{overdue:,.2f}")
-    c.drawString(395, y, f"{current:,.2f}")
-    c.drawString(470, y, f"{running_balance:,.2f}")
-    
-    y -= 5
-    # Line after amounts
-    c.line(320, y, width - right_margin, y)
-    
-    y -= 13
-    
-    # Amount Enclosed
-    c.setFont("Helvetica-Bold", 9)
-    c.drawString(320, y, "Amount Enclosed")
+    c.drawString(440, y - 85, data["company_name"])
     
-    # Save PDF
-    c.save()
+    # Overdue, Current, Total amounts (all on one line)
+    c.drawString(320, y - 118, _format_cents(overdue_cents))
+    c.drawString(395, y - 118, _format_cents(current_cents))
+    c.drawString(470, y - 118, _format_cents(running_cents))
     
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    
-    return pdf_bytes
+    # ReportLab assembles the whole document as one bytes object; return it
+    # directly rather than copying it through a file buffer
+    return c.getpdfdata()
 
 # API Endpoints
-@app.get("/", tags=["Health"])
+@app.get("/", response_model=HealthResponse, tags=["Health"])
 async def root():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "Invoice Statement Generator API",
-        "version": "1.0.0"
-    }
+    return HealthResponse(
+        status="healthy",
+        service="Invoice Statement Generator API",
+        version="1.0.0"
+    )
 
 @app.post(
     "/generate-statement",
@@ -307,19 +461,30 @@ async def generate_statement(request: StatementRequest):
     try:
         logger.info(f"Generating statement for {request.company_name}")
         
-        # Calculate totals
-        overdue = Decimal("0.00")
-        current = Decimal("0.00")
-        
-        # Sum all invoices as overdue
-        for inv in request.invoices:
-            balance = inv.invoice_amount - inv.payments
-            overdue += balance
-        
-        total_due = float(overdue + current)
-        
-        # Generate PDF
-        pdf_bytes = generate_statement_pdf(request)
+        # Generate PDF, reusing a previous render of the same request
+        # Decimals are keyed by their exact text, not the float JSON form
+        key = blake2b(
+            json.dumps(request.model_dump(), default=str, sort_keys=True).encode(),
+            digest_size=16
+        ).digest()
+        pdf_bytes = _pdf_cache.get(key)
+        if pdf_bytes is None:
+            row_balances, running_cents, overdue_cents, current_cents = _aggregate(
+                request.invoices
+            )
+            pdf_bytes = await _run_in_pdf_pool(
+                partial(
+                    generate_statement_pdf,
+                    request.model_dump(),
+                    row_balances=row_balances,
+                    running_cents=running_cents,
+                    overdue_cents=overdue_cents,
+                    current_cents=current_cents
+                )
+            )
+            _cache_pdf(key, pdf_bytes)
+        else:
+            _pdf_cache.move_to_end(key)
         
         logger.info(f"Statement generated successfully. Size: {len(pdf_bytes)} bytes")
         
@@ -332,6 +497,9 @@ async def generate_statement(request: StatementRequest):
             }
         )
         
+    except BrokenProcessPool as e:
+        logger.error(f"PDF workers unavailable: {str(e)}")
+        raise HTTPException(status_code=503, detail="PDF renderer temporarily unavailable, please retry")
     except Exception as e:
         logger.error(f"Error generating statement: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating statement: {str(e)}")
@@ -348,21 +516,14 @@ async def preview_statement(request: StatementRequest):
     Returns totals and summary information.
     """
     try:
-        overdue = Decimal("0.00")
-        current = Decimal("0.00")
-        
-        # Sum all invoices
-        for inv in request.invoices:
-            balance = inv.invoice_amount - inv.payments
-            overdue += balance
-        
-        total_due = float(overdue + current)
+        # Totals are exact cents, so no further rounding is needed
+        _, running_cents, overdue_cents, current_cents = _aggregate(request.invoices)
         
         return StatementResponse(
             message="Statement preview generated successfully",
-            total_due=round(total_due, 2),
-            overdue_amount=round(float(overdue), 2),
-            current_amount=round(float(current), 2),
+            total_due=running_cents / 100,
+            overdue_amount=overdue_cents / 100,
+            current_amount=current_cents / 100,
             file_size=0
         )
     except Exception as e:
@@ -376,4 +537,17 @@ async def value_error_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # One server process per core; uvicorn needs the import string to spawn
+    # them, and each worker rebuilds the font and template caches on import.
+    # Workers inherit WEB_CONCURRENCY and size their PDF pools from it.
+    workers = os.cpu_count() or 1
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run(
+        "index:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level="info"
+    )
\ No newline at end of file